@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from dns_providers import DNSProviderFactory
+from dns_providers import DNSProviderFactory, configure_logging, flush_logging
 import argparse
 import os
 import subprocess
@@ -327,6 +327,9 @@ class CertManager:
 
         cmd = self._build_certbot_command("certonly", domain, email)
 
+        # Write out provider output before certbot runs
+        flush_logging()
+
         try:
             result = subprocess.run(
                 cmd, capture_output=True, text=True, timeout=300)
@@ -481,6 +484,8 @@ def main():
 
     args = parser.parse_args()
 
+    configure_logging()
+
     try:
         manager = CertManager(args.provider)
 
@@ -490,6 +495,7 @@ def main():
                 sys.exit(1)
             if not manager.setup_credentials():
                 sys.exit(1)
+            flush_logging()
             print(f"Setup completed for {manager.provider_type} provider")
             return
 
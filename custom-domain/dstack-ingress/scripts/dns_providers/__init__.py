@@ -1,4 +1,13 @@
 from .base import DNSProvider, DNSRecord, RecordType, CAARecord
 from .factory import DNSProviderFactory
+from .logs import configure_logging, flush_logging
 
-__all__ = ["DNSProvider", "DNSRecord", "RecordType", "CAARecord", "DNSProviderFactory"]
+__all__ = [
+    "DNSProvider",
+    "DNSRecord",
+    "RecordType",
+    "CAARecord",
+    "DNSProviderFactory",
+    "configure_logging",
+    "flush_logging",
+]
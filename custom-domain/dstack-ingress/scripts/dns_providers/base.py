@@ -20,7 +20,7 @@ class RecordType(Enum):
     PTR = "PTR"
 
 
-@dataclass
+@dataclass(slots=True)
 class DNSRecord:
     """Represents a DNS record."""
 
@@ -34,7 +34,7 @@ class DNSRecord:
     data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CAARecord:
     """Represents a CAA record with specific fields."""
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import logging
+import logging.handlers
+import sys
+
+
+def configure_logging() -> None:
+    """Send DNS provider log output to stderr through a memory buffer.
+
+    Records are held until 100 have accumulated, an ERROR is logged, or
+    flush_logging() is called. Call flush_logging() before output whose
+    ordering matters.
+    """
+    logging.basicConfig(
+        handlers=[
+            logging.handlers.MemoryHandler(
+                capacity=100,
+                flushLevel=logging.ERROR,
+                target=logging.StreamHandler(sys.stderr),
+            )
+        ],
+    )
+    logging.getLogger("dns_providers").setLevel(logging.INFO)
+
+
+def flush_logging() -> None:
+    """Write out any buffered log records."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
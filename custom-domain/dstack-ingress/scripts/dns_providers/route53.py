@@ -1,10 +1,40 @@
 #!/usr/bin/env python3
 
+import functools
+import itertools
+import logging
 import os
-import sys
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from .base import DNSProvider, DNSRecord, CAARecord, RecordType
 
+logger = logging.getLogger(__name__)
+
+# Process-wide cache of resolved hosted zones (zone name -> zone ID), shared by
+# every provider instance so repeated lookups don't hit the Route53 API again.
+_HOSTED_ZONE_CACHE: Dict[str, str] = {}
+
+# RecordType members by value, to avoid the Enum lookup for every record set
+_RECORD_TYPES: Dict[str, RecordType] = {rt.value: rt for rt in RecordType}
+
+
+def _suffixes(domain: str) -> Iterator[str]:
+    """Yield the domain and each parent suffix, most specific first.
+
+    e.g. foo.bar.example.com -> foo.bar.example.com, bar.example.com, example.com, com
+    """
+    labels = domain.rstrip(".").split(".")
+    for i in range(len(labels)):
+        yield ".".join(labels[i:])
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """Normalize record name to FQDN with trailing dot (Route53 format)."""
+    if not name.endswith("."):
+        return f"{name}."
+    return name
 
 
 class Route53DNSProvider(DNSProvider):
@@ -18,12 +48,29 @@ class Route53DNSProvider(DNSProvider):
     CERTBOT_PACKAGE = "certbot-dns-route53==5.1.0"
     CERTBOT_PROPAGATION_SECONDS = None
 
+    # Route53 accepts at most 1000 changes per ChangeResourceRecordSets call
+    MAX_CHANGES_PER_BATCH = 1000
+
+    # Route53 allows 5 requests per second per account, so don't run more
+    # lookups than that concurrently
+    MAX_CONCURRENT_REQUESTS = 5
+
+    # Hard-coded CAA issuers for this bridge (Let's Encrypt + AWS ACM)
+    REQUIRED_CAA_ISSUERS = (
+        "letsencrypt.org",
+        "amazon.com",
+        "amazontrust.com",
+        "awstrust.com",
+        "amazonaws.com",
+    )
+
     def __init__(self):
         super().__init__()
 
         # Import boto3 here to avoid requiring it unless Route53 is used
         try:
             import boto3
+            from botocore.config import Config
 
             self.boto3 = boto3
         except ImportError:
@@ -33,13 +80,31 @@ class Route53DNSProvider(DNSProvider):
             )
 
         try:
-            self.client = self.boto3.client("route53")
+            # Keep connections alive between calls and let botocore absorb
+            # Route53 throttling with adaptive client-side rate limiting
+            self.client = self.boto3.client(
+                "route53",
+                config=Config(
+                    max_pool_connections=50,
+                    tcp_keepalive=True,
+                    retries={"mode": "adaptive", "max_attempts": 10},
+                ),
+            )
         except Exception as e:
             raise ValueError(f"Failed to initialize Route53 client: {e}")
 
         self.hosted_zone_id: Optional[str] = None
         self.hosted_zone_name: Optional[str] = None
 
+        # Last known RRSet for each record ID, so deletes can skip the lookup
+        self._record_set_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Resolved (zone ID, zone name, normalized name) for each record name
+        self._prepare_cache: Dict[str, Tuple[str, str, str]] = {}
+
+        # Worker pool for bulk lookups and changes; the boto3 client is thread-safe
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        self._zone_lock = threading.Lock()
 
     def setup_certbot_credentials(self) -> bool:
         """Setup AWS credentials file for certbot.
@@ -62,7 +127,7 @@ class Route53DNSProvider(DNSProvider):
             return True
 
         except Exception as e:
-            print(f"Error setting up AWS credentials: {e}", file=sys.stderr)
+            logger.error(f"Error setting up AWS credentials: {e}")
             return False
 
     def validate_credentials(self) -> bool:
@@ -70,10 +135,10 @@ class Route53DNSProvider(DNSProvider):
         try:
             # Test API access by listing hosted zones (limited response)
             self.client.list_hosted_zones(MaxItems="1")
-            print("✓ AWS Route53 credentials are valid")
+            logger.info("✓ AWS Route53 credentials are valid")
             return True
         except Exception as e:
-            print(f"✗ AWS Route53 credential validation failed: {e}", file=sys.stderr)
+            logger.error(f"✗ AWS Route53 credential validation failed: {e}")
             return False
 
     def _get_hosted_zone_info(self, domain: str) -> Optional[tuple[str, str]]:
@@ -83,7 +148,29 @@ class Route53DNSProvider(DNSProvider):
             Tuple of (hosted_zone_id, hosted_zone_name) or None
         """
         try:
-            # List all hosted zones
+            # Ask Route53 directly for each candidate zone, most specific first.
+            # This is at most one single-item call per label instead of a scan
+            # over every hosted zone in the account.
+            try:
+                for suffix in _suffixes(domain):
+                    response = self.client.list_hosted_zones_by_name(
+                        DNSName=f"{suffix}.", MaxItems="1"
+                    )
+                    zones = response.get("HostedZones", [])
+                    if zones and zones[0]["Name"].rstrip(".") == suffix:
+                        return (zones[0]["Id"].split("/")[-1], suffix)
+
+                # Every possible zone name has been ruled out, so scanning all
+                # hosted zones can't find a match either
+                logger.error(f"No hosted zone found for domain: {domain}")
+                return None
+            except Exception as e:
+                # e.g. the IAM policy only grants route53:ListHostedZones
+                logger.warning(
+                    f"Hosted zone lookup by name failed, scanning all zones: {e}"
+                )
+
+            # Fall back to scanning all hosted zones
             paginator = self.client.get_paginator("list_hosted_zones")
 
             best_match_id = None
@@ -111,129 +198,196 @@ class Route53DNSProvider(DNSProvider):
             if best_match_id:
                 return (best_match_id, best_match_name)
             else:
-                print(f"No hosted zone found for domain: {domain}", file=sys.stderr)
+                logger.error(f"No hosted zone found for domain: {domain}")
                 return None
 
         except Exception as e:
-            print(f"Error getting hosted zone: {e}", file=sys.stderr)
+            logger.error(f"Error getting hosted zone: {e}")
             return None
 
     def _ensure_hosted_zone_id(self, domain: str) -> Optional[str]:
         """Ensure we have a hosted zone ID for the domain, fetching if necessary."""
-        # Check if we can reuse cached zone
-        if self.hosted_zone_id and self.hosted_zone_name:
-            if domain == self.hosted_zone_name or domain.endswith(
-                f".{self.hosted_zone_name}"
-            ):
-                return self.hosted_zone_id
+        zone = self._resolve_hosted_zone(domain)
+        return zone[0] if zone else None
+
+    def _resolve_hosted_zone(self, domain: str) -> Optional[tuple[str, str]]:
+        """Resolve the hosted zone ID and name for the domain, fetching if necessary."""
+        # The cached zone ID and name must be updated together when lookups
+        # run concurrently
+        with self._zone_lock:
+            # Check if we can reuse cached zone
+            if self.hosted_zone_id and self.hosted_zone_name:
+                if domain == self.hosted_zone_name or domain.endswith(
+                    f".{self.hosted_zone_name}"
+                ):
+                    return (self.hosted_zone_id, self.hosted_zone_name)
+
+            # Check if another lookup in this process already resolved the zone
+            for suffix in _suffixes(domain):
+                zone_id = _HOSTED_ZONE_CACHE.get(suffix)
+                if zone_id:
+                    self.hosted_zone_id, self.hosted_zone_name = zone_id, suffix
+                    return (self.hosted_zone_id, self.hosted_zone_name)
+
+            # Fetch zone info
+            zone_info = self._get_hosted_zone_info(domain)
+            if not zone_info:
+                return None
 
-        # Fetch zone info
-        zone_info = self._get_hosted_zone_info(domain)
-        if zone_info:
             self.hosted_zone_id, self.hosted_zone_name = zone_info
-        return self.hosted_zone_id
+            _HOSTED_ZONE_CACHE[self.hosted_zone_name] = self.hosted_zone_id
+            return zone_info
 
     def _normalize_record_name(self, name: str) -> str:
         """Normalize record name to FQDN with trailing dot (Route53 format)."""
-        if not name.endswith("."):
-            return f"{name}."
-        return name
+        return _normalize(name)
+
+    def _prepare(self, name: str) -> Optional[Tuple[str, str, str]]:
+        """Resolve a record name to (hosted_zone_id, hosted_zone_name, normalized_name).
+
+        Results are memoized per instance so batches touching the same names
+        only resolve and normalize each of them once.
+        """
+        prepared = self._prepare_cache.get(name)
+        if prepared:
+            return prepared
+
+        zone = self._resolve_hosted_zone(name)
+        if not zone:
+            return None
+
+        prepared = (zone[0], zone[1], self._normalize_record_name(name))
+        self._prepare_cache[name] = prepared
+        return prepared
 
     def get_dns_records(
         self, name: str, record_type: Optional[RecordType] = None
     ) -> List[DNSRecord]:
         """Get DNS records for a domain."""
-        hosted_zone_id = self._ensure_hosted_zone_id(name)
-        if not hosted_zone_id:
-            print(
-                f"Error: Could not find hosted zone for domain {name}", file=sys.stderr
-            )
+        prepared = self._prepare(name)
+        if not prepared:
+            logger.error(f"Error: Could not find hosted zone for domain {name}")
             return []
 
-        normalized_name = self._normalize_record_name(name)
+        hosted_zone_id, _, normalized_name = prepared
 
-        print(f"Checking for existing DNS records for {name}")
+        logger.info(f"Checking for existing DNS records for {name}")
 
         try:
-            # List resource record sets for the hosted zone
-            paginator = self.client.get_paginator("list_resource_record_sets")
+            # List only the record sets matching the name (and type)
             records = []
 
-            for page in paginator.paginate(HostedZoneId=hosted_zone_id):
-                for record_set in page["ResourceRecordSets"]:
-                    record_name = record_set["Name"]
-                    record_type_str = record_set["Type"]
-
-                    # Filter by name
-                    if record_name != normalized_name:
-                        continue
-
-                    # Filter by type if specified
-                    if record_type and record_type_str != record_type.value:
-                        continue
-
-                    # Parse record content
-                    content = ""
-                    data = None
-
-                    if record_type_str == "CAA":
-                        # CAA records have special format
-                        if "ResourceRecords" in record_set:
-                            caa_value = record_set["ResourceRecords"][0]["Value"]
-                            # Format: "flags tag value"
-                            parts = caa_value.split(" ", 2)
-                            if len(parts) >= 3:
-                                flags = int(parts[0])
-                                tag = parts[1]
-                                value = parts[2].strip('"')
-                                content = caa_value
-                                data = {"flags": flags, "tag": tag, "value": value}
-                    else:
-                        # Standard records
-                        if "ResourceRecords" in record_set:
-                            # Get first record value (multiple values would need separate DNSRecord objects)
-                            content = record_set["ResourceRecords"][0]["Value"]
-                            # Remove quotes from TXT records
-                            if record_type_str == "TXT":
-                                content = content.strip('"')
-                        elif "AliasTarget" in record_set:
-                            # Alias record (Route53 specific)
-                            content = record_set["AliasTarget"]["DNSName"].rstrip(".")
-
-                    # Route53 doesn't have persistent record IDs, use name+type as identifier
-                    record_id = f"{record_name}:{record_type_str}"
-
-                    records.append(
-                        DNSRecord(
-                            id=record_id,
-                            name=name,  # Return original name without trailing dot
-                            type=RecordType(record_type_str),
-                            content=content,
-                            ttl=record_set.get("TTL", 60),
-                            proxied=False,  # Route53 doesn't have proxy feature
-                            priority=None,  # Would be in record value for MX/SRV
-                            data=data,
-                        )
+            for record_set in self._iter_record_sets(
+                hosted_zone_id,
+                normalized_name,
+                record_type.value if record_type else None,
+            ):
+                record_type_str = record_set["Type"]
+
+                # Skip types we don't model (e.g. SOA on the zone apex)
+                record_type_enum = _RECORD_TYPES.get(record_type_str)
+                if not record_type_enum:
+                    continue
+
+                # Parse record content
+                content = ""
+                data = None
+
+                if record_type_str == "CAA":
+                    # CAA records have special format
+                    if "ResourceRecords" in record_set:
+                        caa_value = record_set["ResourceRecords"][0]["Value"]
+                        # Format: "flags tag value"
+                        parts = caa_value.split(" ", 2)
+                        if len(parts) >= 3:
+                            flags = int(parts[0])
+                            tag = parts[1]
+                            value = parts[2].strip('"')
+                            content = caa_value
+                            data = {"flags": flags, "tag": tag, "value": value}
+                else:
+                    # Standard records
+                    if "ResourceRecords" in record_set:
+                        # Get first record value (multiple values would need separate DNSRecord objects)
+                        content = record_set["ResourceRecords"][0]["Value"]
+                        # Remove quotes from TXT records
+                        if record_type_str == "TXT":
+                            content = content.strip('"')
+                    elif "AliasTarget" in record_set:
+                        # Alias record (Route53 specific)
+                        content = record_set["AliasTarget"]["DNSName"].rstrip(".")
+
+                # Route53 doesn't have persistent record IDs, use name+type as identifier
+                record_id = self._record_id(record_set)
+                self._record_set_cache[record_id] = record_set
+
+                records.append(
+                    DNSRecord(
+                        id=record_id,
+                        name=name,  # Return original name without trailing dot
+                        type=record_type_enum,
+                        content=content,
+                        ttl=record_set.get("TTL", 60),
+                        proxied=False,  # Route53 doesn't have proxy feature
+                        priority=None,  # Would be in record value for MX/SRV
+                        data=data,
                     )
+                )
 
             return records
 
         except Exception as e:
-            print(f"Error getting DNS records: {e}", file=sys.stderr)
+            logger.error(f"Error getting DNS records: {e}")
             return []
 
-    def create_dns_record(self, record: DNSRecord) -> bool:
-        """Create a DNS record."""
-        hosted_zone_id = self._ensure_hosted_zone_id(record.name)
-        if not hosted_zone_id:
-            print(
-                f"Error: Could not find hosted zone for domain {record.name}",
-                file=sys.stderr,
-            )
-            return False
+    def _iter_record_sets(
+        self, hosted_zone_id: str, record_name: str, record_type: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the RRSets with the given name (and type, if given) in a zone.
+
+        Route53 lists record sets in sorted order, so listing starts at the
+        requested name/type and stops at the first record set past it instead
+        of reading the whole zone.
+        """
+        paginator = self.client.get_paginator("list_resource_record_sets")
+        params = {"HostedZoneId": hosted_zone_id, "StartRecordName": record_name}
+        if record_type:
+            params["StartRecordType"] = record_type
+
+        # Pages are only requested as the caller pulls record sets, so a caller
+        # that stops early never triggers requests for the remaining pages
+        record_sets = paginator.paginate(**params).search("ResourceRecordSets[]")
+        return itertools.takewhile(
+            lambda record_set: record_set["Name"] == record_name
+            and (not record_type or record_set["Type"] == record_type),
+            record_sets,
+        )
+
+    @staticmethod
+    def _record_id(record_set: Dict[str, Any]) -> str:
+        """Build the "name:type" record ID for an RRSet."""
+        return f"{record_set['Name']}:{record_set['Type']}"
+
+    def get_dns_records_bulk(
+        self, names: List[str], record_type: Optional[RecordType] = None
+    ) -> Dict[str, List[DNSRecord]]:
+        """Get DNS records for several domains concurrently.
 
-        normalized_name = self._normalize_record_name(record.name)
+        Args:
+            names: The record names
+            record_type: Optional record type filter
 
+        Returns:
+            Dict mapping each name to its list of DNS records
+        """
+        futures = {
+            name: self._executor.submit(self.get_dns_records, name, record_type)
+            for name in names
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+    def _build_rrset(self, record: DNSRecord, normalized_name: str) -> Dict[str, Any]:
+        """Build the Route53 ResourceRecordSet for a DNS record."""
         # Prepare record value
         if record.type == RecordType.TXT:
             # TXT records need to be quoted
@@ -241,40 +395,184 @@ class Route53DNSProvider(DNSProvider):
         else:
             record_value = record.content
 
-        # Prepare change batch
-        change_batch = {
-            "Changes": [
-                {
-                    "Action": "UPSERT",  # UPSERT creates or updates
-                    "ResourceRecordSet": {
-                        "Name": normalized_name,
-                        "Type": record.type.value,
-                        "TTL": record.ttl,
-                        "ResourceRecords": [{"Value": record_value}],
-                    },
-                }
-            ]
+        return {
+            "Name": normalized_name,
+            "Type": record.type.value,
+            "TTL": record.ttl,
+            "ResourceRecords": [{"Value": record_value}],
         }
 
-        try:
-            print(f"Adding {record.type.value} record for {record.name}")
+    def _find_record_set(
+        self, hosted_zone_id: str, record_name: str, record_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Find the RRSet with the given name and type in a hosted zone."""
+        # Route53 lists record sets in sorted order, so the first one listed
+        # from the requested name/type is the only possible match
+        response = self.client.list_resource_record_sets(
+            HostedZoneId=hosted_zone_id,
+            StartRecordName=record_name,
+            StartRecordType=record_type,
+            MaxItems="1",
+        )
+        record_sets = response.get("ResourceRecordSets", [])
+        if (
+            record_sets
+            and record_sets[0]["Name"] == record_name
+            and record_sets[0]["Type"] == record_type
+        ):
+            return record_sets[0]
+        return None
+
+    def _change_record_sets(
+        self, hosted_zone_id: str, changes: List[Dict[str, Any]]
+    ) -> bool:
+        """Submit changes to a hosted zone in as few ChangeBatch calls as possible."""
+        for start in range(0, len(changes), self.MAX_CHANGES_PER_BATCH):
+            change_batch = {
+                "Changes": changes[start : start + self.MAX_CHANGES_PER_BATCH]
+            }
             response = self.client.change_resource_record_sets(
                 HostedZoneId=hosted_zone_id, ChangeBatch=change_batch
             )
 
             # Check if change was successful
             change_info = response.get("ChangeInfo", {})
-            if change_info.get("Status") in ["PENDING", "INSYNC"]:
+            if change_info.get("Status") not in ["PENDING", "INSYNC"]:
+                logger.error(f"Unexpected change status: {change_info.get('Status')}")
+                return False
+        return True
+
+    def _delete_record_sets(
+        self,
+        hosted_zone_id: str,
+        changes: List[Dict[str, Any]],
+        cached_ids: Set[str],
+    ) -> bool:
+        """Submit DELETE changes, retrying once with fresh RRSets if cached ones fail.
+
+        Route53 only deletes an RRSet whose details match exactly, so a cached
+        RRSet that went stale makes the whole batch fail.
+        """
+        try:
+            if self._change_record_sets(hosted_zone_id, changes):
                 return True
-            else:
-                print(
-                    f"Unexpected change status: {change_info.get('Status')}",
-                    file=sys.stderr,
+        except Exception as e:
+            if not cached_ids:
+                raise
+            logger.warning(f"Delete with cached record details failed: {e}")
+
+        if not any(
+            self._record_id(change["ResourceRecordSet"]) in cached_ids
+            for change in changes
+        ):
+            return False
+
+        logger.info("Retrying delete with freshly fetched record details")
+        refreshed = []
+        for change in changes:
+            record_set = change["ResourceRecordSet"]
+            record_id = self._record_id(record_set)
+            if record_id in cached_ids:
+                self._record_set_cache.pop(record_id, None)
+                record_set = self._find_record_set(
+                    hosted_zone_id, record_set["Name"], record_set["Type"]
+                )
+                if not record_set:
+                    logger.error(f"Record not found: {record_id}")
+                    return False
+            refreshed.append({"Action": "DELETE", "ResourceRecordSet": record_set})
+        return self._change_record_sets(hosted_zone_id, refreshed)
+
+    def _change_zones(
+        self,
+        changes_by_zone: Dict[str, List[Dict[str, Any]]],
+        submit: Optional[Callable[[str, List[Dict[str, Any]]], bool]] = None,
+    ) -> Dict[str, bool]:
+        """Submit each hosted zone's changes, concurrently when there are several.
+
+        Args:
+            changes_by_zone: Changes to submit, keyed by hosted zone ID
+            submit: Function submitting one zone's changes, defaults to
+                _change_record_sets
+
+        Returns:
+            Dict mapping each hosted zone ID to whether its changes succeeded
+        """
+        submit = submit or self._change_record_sets
+
+        # A single zone gains nothing from the pool, so submit it directly
+        if len(changes_by_zone) == 1:
+            ((hosted_zone_id, changes),) = changes_by_zone.items()
+            return {hosted_zone_id: submit(hosted_zone_id, changes)}
+
+        futures = {
+            hosted_zone_id: self._executor.submit(submit, hosted_zone_id, changes)
+            for hosted_zone_id, changes in changes_by_zone.items()
+        }
+        return {
+            hosted_zone_id: future.result()
+            for hosted_zone_id, future in futures.items()
+        }
+
+    def create_dns_record(self, record: DNSRecord) -> bool:
+        """Create a DNS record."""
+        return self.create_dns_records([record])
+
+    def create_dns_records(self, records: List[DNSRecord]) -> bool:
+        """Create several DNS records with one ChangeBatch per hosted zone.
+
+        Records sharing a name and type are merged into a single RRSet, since
+        Route53 rejects a ChangeBatch that changes the same RRSet twice.
+        """
+        rrsets_by_zone: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        for record in records:
+            prepared = self._prepare(record.name)
+            if not prepared:
+                logger.error(
+                    f"Error: Could not find hosted zone for domain {record.name}"
                 )
                 return False
 
+            hosted_zone_id, _, normalized_name = prepared
+            logger.info(f"Adding {record.type.value} record for {record.name}")
+            rrset = self._build_rrset(record, normalized_name)
+            zone_rrsets = rrsets_by_zone.setdefault(hosted_zone_id, {})
+            existing = zone_rrsets.setdefault(self._record_id(rrset), rrset)
+            if existing is rrset:
+                continue
+
+            if existing["TTL"] != rrset["TTL"]:
+                logger.error(
+                    f"Conflicting TTLs for {record.type.value} record {record.name}: "
+                    f"{existing['TTL']} and {rrset['TTL']}"
+                )
+                return False
+            for value in rrset["ResourceRecords"]:
+                if value not in existing["ResourceRecords"]:
+                    existing["ResourceRecords"].append(value)
+
+        changes_by_zone = {
+            hosted_zone_id: [
+                # UPSERT creates or updates
+                {"Action": "UPSERT", "ResourceRecordSet": rrset}
+                for rrset in zone_rrsets.values()
+            ]
+            for hosted_zone_id, zone_rrsets in rrsets_by_zone.items()
+        }
+
+        try:
+            results = self._change_zones(changes_by_zone)
+            for hosted_zone_id, changes in changes_by_zone.items():
+                if not results[hosted_zone_id]:
+                    continue
+                for change in changes:
+                    record_set = change["ResourceRecordSet"]
+                    self._record_set_cache[self._record_id(record_set)] = record_set
+            return all(results.values())
+
         except Exception as e:
-            print(f"Error creating DNS record: {e}", file=sys.stderr)
+            logger.error(f"Error creating DNS record: {e}")
             return False
 
     def delete_dns_record(self, record_id: str, domain: str) -> bool:
@@ -284,65 +582,72 @@ class Route53DNSProvider(DNSProvider):
             record_id: Format is "name:type" since Route53 doesn't have persistent IDs
             domain: The domain name (for zone lookup)
         """
-        hosted_zone_id = self._ensure_hosted_zone_id(domain)
-        if not hosted_zone_id:
-            print(
-                f"Error: Could not find hosted zone for domain {domain}",
-                file=sys.stderr,
-            )
-            return False
+        return self.delete_dns_records([(record_id, domain)])
 
-        # Parse record_id to get name and type
-        try:
-            record_name, record_type = record_id.split(":", 1)
-        except ValueError:
-            print(f"Invalid record_id format: {record_id}", file=sys.stderr)
-            return False
+    def delete_dns_records(self, ids: List[Tuple[str, str]]) -> bool:
+        """Delete several DNS records with one ChangeBatch per hosted zone.
 
-        try:
-            # First, get the current record to know its full details
-            paginator = self.client.get_paginator("list_resource_record_sets")
-            record_set_to_delete = None
+        Args:
+            ids: List of (record_id, domain) pairs, as for delete_dns_record
+        """
+        changes_by_zone: Dict[str, List[Dict[str, Any]]] = {}
+        cached_ids: Set[str] = set()
 
-            for page in paginator.paginate(HostedZoneId=hosted_zone_id):
-                for record_set in page["ResourceRecordSets"]:
-                    if (
-                        record_set["Name"] == record_name
-                        and record_set["Type"] == record_type
-                    ):
-                        record_set_to_delete = record_set
-                        break
+        for record_id, domain in ids:
+            prepared = self._prepare(domain)
+            if not prepared:
+                logger.error(f"Error: Could not find hosted zone for domain {domain}")
+                return False
+
+            hosted_zone_id = prepared[0]
+
+            # Parse record_id to get name and type
+            try:
+                record_name, record_type = record_id.split(":", 1)
+            except ValueError:
+                logger.error(f"Invalid record_id format: {record_id}")
+                return False
+
+            try:
+                # Get the current record to know its full details
+                record_set_to_delete = self._record_set_cache.get(record_id)
                 if record_set_to_delete:
-                    break
+                    cached_ids.add(record_id)
+                else:
+                    record_set_to_delete = self._find_record_set(
+                        hosted_zone_id, record_name, record_type
+                    )
+            except Exception as e:
+                logger.error(f"Error deleting DNS record: {e}")
+                return False
 
             if not record_set_to_delete:
-                print(f"Record not found: {record_id}", file=sys.stderr)
+                logger.error(f"Record not found: {record_id}")
                 return False
 
-            # Prepare DELETE change batch with exact record details
-            change_batch = {
-                "Changes": [
-                    {"Action": "DELETE", "ResourceRecordSet": record_set_to_delete}
-                ]
-            }
-
-            print(f"Deleting record: {record_id}")
-            response = self.client.change_resource_record_sets(
-                HostedZoneId=hosted_zone_id, ChangeBatch=change_batch
+            logger.info(f"Deleting record: {record_id}")
+            # DELETE requires the exact record details
+            changes_by_zone.setdefault(hosted_zone_id, []).append(
+                {"Action": "DELETE", "ResourceRecordSet": record_set_to_delete}
             )
 
-            change_info = response.get("ChangeInfo", {})
-            if change_info.get("Status") in ["PENDING", "INSYNC"]:
-                return True
-            else:
-                print(
-                    f"Unexpected change status: {change_info.get('Status')}",
-                    file=sys.stderr,
-                )
-                return False
+        try:
+            results = self._change_zones(
+                changes_by_zone,
+                lambda hosted_zone_id, changes: self._delete_record_sets(
+                    hosted_zone_id, changes, cached_ids
+                ),
+            )
+            for hosted_zone_id, changes in changes_by_zone.items():
+                if not results[hosted_zone_id]:
+                    continue
+                for change in changes:
+                    record_set = change["ResourceRecordSet"]
+                    self._record_set_cache.pop(self._record_id(record_set), None)
+            return all(results.values())
 
         except Exception as e:
-            print(f"Error deleting DNS record: {e}", file=sys.stderr)
+            logger.error(f"Error deleting DNS record: {e}")
             return False
 
     def create_caa_record(self, caa_record: CAARecord) -> bool:
@@ -354,53 +659,29 @@ class Route53DNSProvider(DNSProvider):
         - Merges hard-coded issuers with any existing CAA values on the apex
         """
         # Ensure we know which hosted zone this belongs to
-        hosted_zone_id = self._ensure_hosted_zone_id(caa_record.name)
-        if not hosted_zone_id:
-            print(
-                f"Error: Could not find hosted zone for domain {caa_record.name}",
-                file=sys.stderr,
+        zone = self._resolve_hosted_zone(caa_record.name)
+        if not zone:
+            logger.error(
+                f"Error: Could not find hosted zone for domain {caa_record.name}"
             )
             return False
 
-        if not self.hosted_zone_name:
-            print("Error: Hosted zone name is not set", file=sys.stderr)
-            return False
-
-        apex_name = self.hosted_zone_name  # apex of the zone
+        hosted_zone_id, apex_name = zone  # apex of the zone
         normalized_name = self._normalize_record_name(apex_name)
 
-        # Hard-coded issuers for this bridge (Let's Encrypt + AWS ACM)
-        required_issuers = [
-            "letsencrypt.org",
-            "amazon.com",
-            "amazontrust.com",
-            "awstrust.com",
-            "amazonaws.com",
-        ]
-
         # Build the desired CAA "issue" values from the issuers
         required_values = [
             f'{caa_record.flags} {caa_record.tag} "{issuer}"'
-            for issuer in required_issuers
+            for issuer in self.REQUIRED_CAA_ISSUERS
         ]
 
         # Look up any existing CAA RRSet on the apex
-        paginator = self.client.get_paginator("list_resource_record_sets")
-        existing_rrset = None
-
         try:
-            for page in paginator.paginate(HostedZoneId=hosted_zone_id):
-                for record_set in page["ResourceRecordSets"]:
-                    if (
-                        record_set["Name"] == normalized_name
-                        and record_set["Type"] == "CAA"
-                    ):
-                        existing_rrset = record_set
-                        break
-                if existing_rrset:
-                    break
+            existing_rrset = self._find_record_set(
+                hosted_zone_id, normalized_name, "CAA"
+            )
         except Exception as e:
-            print(f"Error listing existing CAA records: {e}", file=sys.stderr)
+            logger.error(f"Error listing existing CAA records: {e}")
             return False
 
         existing_values: List[str] = []
@@ -411,21 +692,20 @@ class Route53DNSProvider(DNSProvider):
                 rr["Value"] for rr in existing_rrset.get("ResourceRecords", [])
             ]
             ttl = existing_rrset.get("TTL", ttl)
-            print(
+            logger.info(
                 f"Found existing CAA RRSet on apex {apex_name}, merging with "
                 f"required issuers"
             )
         else:
-            print(f"No existing CAA RRSet on apex {apex_name}, creating new one")
+            logger.info(f"No existing CAA RRSet on apex {apex_name}, creating new one")
 
         # Merge: keep all existing values, add any missing required issuer values
-        merged_values = list(existing_values)
-        for value in required_values:
-            if value not in merged_values:
-                merged_values.append(value)
+        existing_set = set(existing_values)
+        missing_values = [v for v in required_values if v not in existing_set]
+        merged_values = existing_values + missing_values
 
         if not merged_values:
-            print("No CAA values to set on apex after merge; aborting", file=sys.stderr)
+            logger.error("No CAA values to set on apex after merge; aborting")
             return False
 
         # Prepare change batch with the merged RRSet
@@ -444,7 +724,7 @@ class Route53DNSProvider(DNSProvider):
         }
 
         try:
-            print(
+            logger.info(
                 f"Setting merged CAA record set for apex {apex_name}: "
                 f"{', '.join(merged_values)}"
             )
@@ -454,15 +734,17 @@ class Route53DNSProvider(DNSProvider):
 
             change_info = response.get("ChangeInfo", {})
             if change_info.get("Status") in ["PENDING", "INSYNC"]:
+                # Keep the cached apex RRSet in line so a later delete matches
+                record_set = change_batch["Changes"][0]["ResourceRecordSet"]
+                self._record_set_cache[self._record_id(record_set)] = record_set
                 return True
             else:
-                print(
+                logger.error(
                     f"Unexpected change status for CAA apex update: "
                     f"{change_info.get('Status')}",
-                    file=sys.stderr,
                 )
                 return False
 
         except Exception as e:
-            print(f"Error creating/merging apex CAA record: {e}", file=sys.stderr)
+            logger.error(f"Error creating/merging apex CAA record: {e}")
             return False
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from dns_providers import DNSProviderFactory
+from dns_providers import DNSProviderFactory, configure_logging, flush_logging
 import argparse
 import os
 import sys
@@ -30,6 +30,8 @@ def main():
 
     args = parser.parse_args()
 
+    configure_logging()
+
     try:
         # Create DNS provider instance
         provider = DNSProviderFactory.create_provider(args.provider)
@@ -40,6 +42,7 @@ def main():
                 sys.exit(1)
 
             success = provider.set_alias_record(args.domain, args.content)
+            flush_logging()
             if not success:
                 print(f"Failed to set alias record for {args.domain}", file=sys.stderr)
                 sys.exit(1)
@@ -51,6 +54,7 @@ def main():
                 sys.exit(1)
 
             success = provider.set_alias_record(args.domain, args.content)
+            flush_logging()
             if not success:
                 print(f"Failed to set alias record for {args.domain}", file=sys.stderr)
                 sys.exit(1)
@@ -62,6 +66,7 @@ def main():
                 sys.exit(1)
 
             success = provider.set_txt_record(args.domain, args.content)
+            flush_logging()
             if not success:
                 print(f"Failed to set TXT record for {args.domain}", file=sys.stderr)
                 sys.exit(1)
@@ -76,6 +81,7 @@ def main():
                 sys.exit(1)
 
             success = provider.set_caa_record(args.domain, args.caa_tag, args.caa_value)
+            flush_logging()
             if not success:
                 print(f"Failed to set CAA record for {args.domain}", file=sys.stderr)
                 sys.exit(1)